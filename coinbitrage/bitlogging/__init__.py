@@ -1,32 +1,132 @@
+import atexit
+import copy
+import functools
 import logging
+import os
+import queue
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
-import yaml
-
-from .adapters import BitLoggerAdapter
+from .adapters import BitLoggerAdapter, _LazyMsg
 from .filters import EventNameFilter
 from .formatters import BaseFormatter, JSONFormatter
 
 
-LOG_DIR = Path().resolve()/'logs'
-LOG_DIR.mkdir(exist_ok=True)
-CONFIG_FILE = Path().resolve()/'log_config.yaml'
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+CONFIG_FILE = ROOT_DIR/'log_config.yaml'
+LOG_DIR_ENV_VAR = 'COINBITRAGE_LOG_DIR'
+
+_listeners = []
 
 
 def configure(debug: bool = False):
-    with CONFIG_FILE.open('rt') as f:
-        config = yaml.safe_load(f.read())
+    log_dir = _log_dir()
+    log_dir.mkdir(parents=True, exist_ok=True)
+    config = _load_config()
 
-    config['handlers']['file']['filename'] = str(LOG_DIR/'all.log')
-    config['handlers']['order']['filename'] = str(LOG_DIR/'orders.log')
+    config['handlers']['file']['filename'] = str(log_dir/'all.log')
+    config['handlers']['order']['filename'] = str(log_dir/'orders.log')
 
     if debug:
         config['disable_existing_loggers'] = False
         config['handlers']['console']['level'] = 'DEBUG'
 
+    # Old handlers stay referenced by their listeners until dictConfig has
+    # flushed and closed them
+    _stop_listeners()
     dictConfig(config)
+    del _listeners[:]
+
+    # Hand records off to a background thread so callers never block on
+    # formatting or disk I/O
+    _start_listener(logging.getLogger())
+    for name in config.get('loggers', {}):
+        _start_listener(logging.getLogger(name))
+
+
+def _log_dir() -> Path:
+    """Logs go to $COINBITRAGE_LOG_DIR if it is set. Otherwise they go next to the source tree
+    when running from a checkout, or under the working directory for an installed package, whose
+    parent directories (site-packages or the interpreter prefix) are often not writable.
+    """
+    env_dir = os.environ.get(LOG_DIR_ENV_VAR)
+    if env_dir:
+        return Path(env_dir).expanduser()
+    if CONFIG_FILE.exists():
+        return ROOT_DIR/'logs'
+    return Path.cwd()/'logs'
+
+
+def _load_config() -> dict:
+    # Installed builds ship log_config.yaml pre-compiled to a dict literal (see
+    # compile_log_config.py); the YAML file is only parsed when running from a source tree,
+    # or when it has been edited since it was last compiled
+    try:
+        from . import _config
+    except ImportError:
+        pass
+    else:
+        if not CONFIG_FILE.exists() or Path(_config.__file__).stat().st_mtime >= CONFIG_FILE.stat().st_mtime:
+            return copy.deepcopy(_config.CONFIG)
+
+    import yaml
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
+    with CONFIG_FILE.open('rt') as f:
+        return yaml.load(f, Loader=Loader)
 
 
+@functools.lru_cache(maxsize=None)
 def getLogger(name: str):
     return BitLoggerAdapter(logging.getLogger(name))
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Queues records without formatting them first, so that messages are rendered on the
+    listener thread instead of the one that logged them. The queue never leaves the process, so
+    records don't have to be made picklable; the event data is copied so that later changes to
+    it by the caller can't leak into the record.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        event_data = record.__dict__.get('event_data')
+        if event_data:
+            record.event_data = event_data = dict(event_data)
+            if isinstance(record.msg, _LazyMsg):
+                record.msg = _LazyMsg(record.msg.msg, event_data)
+        return record
+
+
+def _start_listener(logger: logging.Logger):
+    handlers = list(logger.handlers)
+    if not handlers:
+        return
+
+    for handler in handlers:
+        logger.removeHandler(handler)
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(_DeferredQueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners.append(listener)
+
+
+def flush():
+    """Push buffered records out to their targets. The file buffer only flushes on its own once
+    it fills up or sees an error, so long-running callers should call this periodically.
+    """
+    for listener in _listeners:
+        for handler in listener.handlers:
+            handler.flush()
+
+
+@atexit.register
+def _stop_listeners():
+    for listener in _listeners:
+        listener.stop()
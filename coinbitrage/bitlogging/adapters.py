@@ -1,27 +1,70 @@
 import logging
 
 
+# Shared by every record logged without event info; never mutate these
+_EMPTY_DATA = {}
+_EMPTY_EXTRA = {'event_name': '', 'event_data': _EMPTY_DATA}
+
+
+class _SafeDict(dict):
+    """Leaves placeholders without a matching event_data key in the message as-is."""
+
+    def __missing__(self, key):
+        return '{' + key + '}'
+
+
+class _LazyMsg(object):
+    """Renders a message template with its event data only when the record is emitted."""
+    __slots__ = ('msg', 'data')
+
+    def __init__(self, msg: str, data: dict):
+        self.msg = msg
+        self.data = data
+
+    def __str__(self):
+        try:
+            return self.msg.format_map(_SafeDict(self.data))
+        except (AttributeError, IndexError, KeyError, TypeError, ValueError):
+            # Malformed or positional placeholders, or values that don't fit their format spec
+            # (e.g. '{price:.2f}' with a None price). This runs on the log listener thread, where
+            # an exception would drop the record altogether, so the raw template is logged instead
+            return self.msg
+
+
 class BitLoggerAdapter(logging.LoggerAdapter):
+    # LoggerAdapter has a __dict__, so these only speed up the pre-bound logger methods
+    __slots__ = ('_log', '_is_enabled_for')
 
     def __init__(self, logger):
-        super(BitLoggerAdapter, self).__init__(logger, {'event_name': '', 'event_data': {}})
+        super(BitLoggerAdapter, self).__init__(logger, _EMPTY_EXTRA)
+        self._log = logger._log
+        self._is_enabled_for = logger.isEnabledFor
 
     def log(self, level, msg, *args, **kwargs):
-        if self.isEnabledFor(level):
-            self.extra = {'event_name': '', 'event_data': {}}
-            if 'event_name' in kwargs:
-                self.extra['event_name'] = kwargs.pop('event_name')
-            if 'event_data' in kwargs:
-                self.extra['event_data'] = kwargs.pop('event_data')
+        if self._is_enabled_for(level):
+            # Adapters are shared between threads (see bitlogging.getLogger), so each call builds
+            # its own extra dict rather than storing it on self.extra
+            if 'event_name' in kwargs or 'event_data' in kwargs:
+                extra = {'event_name': kwargs.pop('event_name', ''),
+                         'event_data': kwargs.pop('event_data', _EMPTY_DATA)}
+            else:
+                extra = _EMPTY_EXTRA
+
+            if 'extra' in kwargs:
+                kwargs['extra'] = {**extra, **kwargs['extra']}
+            else:
+                kwargs['extra'] = extra
 
             msg, kwargs = self.process(msg, kwargs)
-            self.logger._log(level, msg, args, **kwargs)
+            self._log(level, msg, args, **kwargs)
 
     def process(self, msg, kwargs):
-        msg, kwargs = super(BitLoggerAdapter, self).process(msg, kwargs)
-        try:
-            # TODO: Move this to a custom formatter
-            formatted_msg = str(msg).format(**self.extra.get('event_data', {}))
-        except (IndexError, KeyError):
-            formatted_msg = msg
-        return formatted_msg, kwargs
+        extra = kwargs.setdefault('extra', self.extra)
+        event_data = extra.get('event_data', _EMPTY_DATA)
+        if not event_data:
+            return msg, kwargs
+        if not isinstance(msg, str):
+            msg = str(msg)
+        if '{' not in msg:
+            return msg, kwargs
+        return _LazyMsg(msg, event_data), kwargs
@@ -9,4 +9,8 @@ class EventNameFilter(logging.Filter):
         self._contains = contains
 
     def filter(self, record: logging.LogRecord) -> bool:
-        return self._contains in record.event_name.split('.')
+        # Tokenize once per record; every EventNameFilter on its path shares the result
+        tokens = record.__dict__.get('_event_tokens')
+        if tokens is None:
+            tokens = record._event_tokens = frozenset(record.event_name.split('.'))
+        return self._contains in tokens
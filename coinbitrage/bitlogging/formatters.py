@@ -1,43 +1,103 @@
-import datetime
-import json
 import logging
-import pytz
-from json import JSONEncoder
+import time
 
-from tzlocal import get_localzone
+import orjson
 
 
 class BaseFormatter(logging.Formatter):
-    converter = datetime.datetime.fromtimestamp
 
     def __init__(self, fmt: str = None, datefmt: str = None, style: str = '%', as_utc: bool = True):
         super(BaseFormatter, self).__init__(fmt=fmt, style=style)
         self.datefmt = datefmt
         self.as_utc = as_utc
+        self.converter = time.gmtime if as_utc else time.localtime
+        # '{' templates are rendered straight from the record's dict rather than through
+        # str.format(**kwargs), which would copy it for every record
+        self._format_map = self._fmt.format_map if style == '{' and self._fmt else None
+        self._time_cache = (None, None, None, None)
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = _get_message(record)
+        if self.usesTime():
+            record.asctime = self.formatTime(record, self.datefmt)
+        s = self.formatMessage(record)
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != '\n':
+                s = s + '\n'
+            s = s + record.exc_text
+        if record.stack_info:
+            if s[-1:] != '\n':
+                s = s + '\n'
+            s = s + self.formatStack(record.stack_info)
+        return s
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        if self._format_map:
+            return self._format_map(record.__dict__)
+        return super(BaseFormatter, self).formatMessage(record)
 
     def formatTime(self, record: logging.LogRecord, datefmt: str = None) -> str:
         datefmt = datefmt or self.datefmt
-        tz = pytz.utc if self.as_utc else get_localzone()
-        ct = self.converter(record.created).astimezone(tz)
-
-        if datefmt:
-            s = ct.strftime(datefmt)
-        else:
-            t = ct.strftime(self.default_time_format)
-            s = self.default_msec_format % (t, record.msecs)
-        return s
+        sec = int(record.created)
 
+        # Everything but the sub-second digits is the same for all records logged within
+        # one second, so the strftime output is cached per second as (head, tail) around %f
+        cached_sec, cached_datefmt, head, tail = self._time_cache
+        if sec != cached_sec or datefmt != cached_datefmt:
+            ct = self.converter(sec)
+            fmt = datefmt or self.default_time_format
+            if self.as_utc:
+                # gmtime() names its zone GMT
+                fmt = fmt.replace('%Z', 'UTC')
+            if '%f' in fmt:
+                head, _, tail = fmt.partition('%f')
+                head, tail = time.strftime(head, ct), time.strftime(tail, ct)
+            else:
+                head, tail = time.strftime(fmt, ct), None
+            self._time_cache = (sec, datefmt, head, tail)
 
-class JSONFormatter(BaseFormatter):
+        if not datefmt:
+            return self.default_msec_format % (head, record.msecs)
+        if tail is None:
+            return head
+        usec = min(int(round((record.created - sec) * 1e6)), 999999)
+        return '%s%06d%s' % (head, usec, tail)
 
-    class BitLogJSONEncoder(JSONEncoder):
-        def default(self, o):
-            if isinstance(o, set):
-                return list(o)
-            if isinstance(o, object):
-                return repr(o)
-            return JSONEncoder.default(self, o)
+
+def _get_message(record: logging.LogRecord) -> str:
+    # The same record goes through a formatter per handler; interpolate its message once
+    message = record.__dict__.get('message')
+    if message is None:
+        message = record.message = record.getMessage()
+    return message
+
+
+def _json_default(o):
+    if isinstance(o, (set, frozenset)):
+        return list(o)
+    return repr(o)
+
+
+class JSONFormatter(BaseFormatter):
+    fields = ('asctime', 'name', 'levelname', 'event_name', 'event_data', 'message')
+    _json_options = orjson.OPT_NON_STR_KEYS
 
     def format(self, record: logging.LogRecord) -> str:
+        record.message = _get_message(record)
         record.asctime = self.formatTime(record)
-        return json.dumps(record.__dict__, cls=self.BitLogJSONEncoder, sort_keys=True)
+        attrs = record.__dict__
+        payload = {field: attrs.get(field) for field in self.fields}
+        self._add_traces(record, payload)
+        return orjson.dumps(payload, default=_json_default, option=self._json_options).decode()
+
+    def _add_traces(self, record: logging.LogRecord, payload: dict):
+        """Adds the record's traceback and stack, if any, which aren't among the fixed fields."""
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload['exc_text'] = record.exc_text
+        if record.stack_info:
+            payload['stack_info'] = self.formatStack(record.stack_info)
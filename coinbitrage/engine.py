@@ -1,33 +1,148 @@
-import asyncio
-import copy
-import logging
-import time
 from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor
-from contextlib import contextmanager
-from functools import partial
-from itertools import product
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from threading import Event
+from typing import List, Optional, Tuple, Union
 
-import pandas as pd
-from requests.exceptions import RequestException, Timeout
+import numpy as np
+from requests.exceptions import RequestException
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 from coinbitrage import bitlogging
-from coinbitrage.exchanges.errors import ServerError
 from coinbitrage.exchanges.manager import ExchangeManager
-from coinbitrage.exchanges.mixins import SeparateTradingAccountMixin, WebsocketOrderBookMixin
 from coinbitrage.settings import CURRENCIES, Defaults
-from coinbitrage.utils import RunEvery, format_floats
+from coinbitrage.utils import RunEvery
 
 
 REBALANCE_FUNDS_EVERY = 60 * 15  # Rebalance funds every 15 minutes
 PRINT_TABLE_EVERY = 60 * 1  # Print table every minute
+FLUSH_LOGS_EVERY = 30  # Write buffered log records to disk every 30 seconds
+BOOK_UPDATE_TIMEOUT = 1  # Longest wait for an order book update before running periodic tasks anyway
 
 
 log = bitlogging.getLogger(__name__)
 
 
 OrderSpec = namedtuple('OrderSpec', ['buy_price', 'buy_limit_price', 'sell_price', 'sell_limit_price', 'order_size', 'profit'])
+MarketSnapshot = namedtuple('MarketSnapshot', ['asks', 'bids', 'buy_fees', 'sell_fees', 'tx_fees', 'quote_balances', 'base_balances'])
+Opportunity = namedtuple('Opportunity', ['base_currency', 'quote_currency', 'buy_exchange', 'buy_price',
+                                         'buy_limit_price', 'sell_exchange', 'sell_price', 'sell_limit_price',
+                                         'gross_percent_profit', 'net_percent_profit', 'net_profit', 'gross_profit',
+                                         'order_size', 'total_tx_fee', 'total_fees', 'buy_tx_fee', 'sell_tx_fee',
+                                         'buy_fee', 'sell_fee', 'buy_power', 'sell_power'])
+
+
+def _jit(func):
+    """Compiles `func` with numba when it is installed, otherwise leaves it as plain Python."""
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=True)(func)
+
+
+def _to_levels(levels: np.ndarray):
+    # Order books come back as (k, 2) float arrays, which numba takes as-is; plain Python
+    # indexes nested lists faster than arrays
+    if njit is None:
+        return levels.tolist()
+    return levels
+
+
+@_jit
+def _walk_books(asks, bids, max_order_size, buffer_pct, tx_fee):
+    """Walks down both sides of the books at once to find the order size with the best net percent
+    profit. `asks` and `bids` are sequences of (price, size) levels, best first.
+
+    :returns: the fields of an OrderSpec; the order size is 0 if the books are too thin
+    """
+    no_order = (0., 0., 0., 0., 0., 0.)
+    n_asks = len(asks)
+    n_bids = len(bids)
+    if n_asks == 0 or n_bids == 0:
+        return no_order
+
+    i = j = 0
+    ask_price, ask_size = asks[0][0], asks[0][1]
+    bid_price, bid_size = bids[0][0], bids[0][1]
+
+    # Take buffer off the top of the order book to make order success more likely
+    buffer_remaining = max_order_size * buffer_pct
+    while buffer_remaining > 0:
+        if buffer_remaining < min(ask_size, bid_size):
+            ask_size -= buffer_remaining
+            bid_size -= buffer_remaining
+            buffer_remaining = 0.
+        elif ask_size < bid_size:
+            buffer_remaining -= ask_size
+            bid_size -= ask_size
+            i += 1
+            if i == n_asks:
+                return no_order
+            ask_price, ask_size = asks[i][0], asks[i][1]
+        else:
+            buffer_remaining -= bid_size
+            ask_size -= bid_size
+            j += 1
+            if j == n_bids:
+                return no_order
+            bid_price, bid_size = bids[j][0], bids[j][1]
+
+    best_order = no_order
+    vol_remaining = max_order_size
+    total_size = 0.
+    ask_cost = bid_cost = 0.
+
+    while vol_remaining > 0:
+        if vol_remaining < min(ask_size, bid_size):
+            ask_cost += ask_price * vol_remaining
+            bid_cost += bid_price * vol_remaining
+            total_size += vol_remaining
+            vol_remaining = 0.
+        elif ask_size < bid_size:
+            ask_cost += ask_price * ask_size
+            bid_cost += bid_price * ask_size
+            bid_size -= ask_size
+            total_size += ask_size
+            vol_remaining -= ask_size
+            i += 1
+            if i == n_asks:
+                break
+            ask_price, ask_size = asks[i][0], asks[i][1]
+        else:
+            ask_cost += ask_price * bid_size
+            bid_cost += bid_price * bid_size
+            ask_size -= bid_size
+            total_size += bid_size
+            vol_remaining -= bid_size
+            j += 1
+            if j == n_bids:
+                break
+            bid_price, bid_size = bids[j][0], bids[j][1]
+
+        avg_ask = ask_cost / total_size
+        avg_bid = bid_cost / total_size
+
+        gross_profit = bid_cost - ask_cost
+        net_profit = gross_profit - (tx_fee * avg_ask)
+        net_percent_profit = net_profit / ask_cost
+
+        if best_order[4] == 0. or net_percent_profit > best_order[5]:
+            best_order = (avg_ask, ask_price, avg_bid, bid_price, total_size, net_percent_profit)
+
+    return best_order
+
+
+def compile_kernels():
+    """Compiles the numba kernels ahead of the first arbitrage scan. They are cached on disk, so
+    running this once at deploy time (`coin warmup`) also spares later processes the compile.
+    """
+    if njit is None:
+        return
+    # Same argument types as the scan passes, so the cached specialization is the one used
+    levels = np.array([[1., 1.]], dtype=np.float64)
+    _walk_books(levels, levels, np.float64(1.), Defaults.ORDER_BOOK_BUFFER, np.float64(0.))
 
 
 class ArbitrageEngine(object):
@@ -41,41 +156,51 @@ class ArbitrageEngine(object):
                  **kwargs):
         self.base_currencies = base_currency if isinstance(base_currency, list) else [base_currency]
         self.quote_currency = quote_currency
-        self._loop = asyncio.get_event_loop()
-        self._exchanges = ExchangeManager(exchanges, base_currency, quote_currency, loop=self._loop, **kwargs)
+        self._exchanges = ExchangeManager(exchanges, base_currency, quote_currency, **kwargs)
         self._min_profit_threshold = min_profit
+        self._min_order_sizes = {c: CURRENCIES[c]['min_order_size'] for c in self.base_currencies}
         self._arbitrage_table = None
+        self._last_profits = {}
         self._is_dry_run = dry_run
+        self._order_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='order')
+        self._book_updated = Event()
 
     def run(self, verbose: bool = False):
-        """Runs the arbitrage strategy in a loop, checking at each iteration whether there is an
-         opportunity to profit. Every few minutes it will perform other tasks such as rebalancing
-         funds between exchanges or printing the current arbitrage table to stdout."""
+        """Runs the arbitrage strategy in a loop, checking whether there is an opportunity to profit
+         each time an order book changes. Every few minutes it will perform other tasks such as
+         rebalancing funds between exchanges or printing the current arbitrage table to stdout."""
         manage_exchanges = RunEvery(self._exchanges.manage_exchanges, delay=REBALANCE_FUNDS_EVERY)
         print_table = RunEvery(self._print_arbitrage_table, delay=PRINT_TABLE_EVERY)
+        flush_logs = RunEvery(bitlogging.flush, delay=FLUSH_LOGS_EVERY, first_delay=True)
+        compile_kernels()
 
-        with self._exchanges.live_updates():
+        with self._exchanges.live_updates(on_update=lambda pair: self._book_updated.set()):
             try:
                 while True:
                     manage_exchanges()
-                    self._attempt_arbitrage()
+                    # Nothing can have changed since the last scan until some order book updates
+                    if self._book_updated.wait(timeout=BOOK_UPDATE_TIMEOUT):
+                        self._book_updated.clear()
+                        self._attempt_arbitrage()
                     if verbose:
                         print_table()
+                    flush_logs()
             except KeyboardInterrupt:
                 pass
             except Exception as e:
                 log.exception(e, event_name='error.general')
             finally:
-                self._loop.close()
+                self._order_executor.shutdown(wait=False)
 
     def _print_arbitrage_table(self):
-        """Print the current arbitrage table to stdout."""
+        """Print the arbitrage table from the latest scan of each currency to stdout."""
         for currency in self.base_currencies:
-            self.arbitrage_table(currency)
-            if not self._arbitrage_table.empty:
+            table = self._render_profit_table(currency)
+            if table:
                 print()
                 print(currency)
-                print(self._arbitrage_table)
+                print(table)
+                print('(~ estimated from the top of the order books)')
                 print()
 
     def _attempt_arbitrage(self):
@@ -87,47 +212,130 @@ class ArbitrageEngine(object):
             if not opportunity:
                 return
 
-            if self._should_execute(**opportunity):
-                self._execute_arbitrage(**opportunity)
+            if self._should_execute(opportunity):
+                self._execute_arbitrage(opportunity)
+
+    def _snapshot_market(self, base_currency: str, buy_exchanges: list, sell_exchanges: list) -> MarketSnapshot:
+        """Collects the top of each order book along with fees and balances into arrays, so that
+        every buy/sell pairing can be estimated at once.
+        """
+        def to_array(values):
+            return np.fromiter(values, dtype=np.float64)
+
+        quote_currency = self.quote_currency
+        balance = self._exchanges.balance
+        fee = self._exchanges.fee
+        tx_fee = self._exchanges.tx_fee
+        return MarketSnapshot(
+            asks=to_array(x.ask(base_currency) for x in buy_exchanges),
+            bids=to_array(x.bid(base_currency) for x in sell_exchanges),
+            buy_fees=to_array(fee(x, base_currency) for x in buy_exchanges),
+            sell_fees=to_array(fee(x, base_currency) for x in sell_exchanges),
+            # Only the buy side transfers funds
+            tx_fees=to_array(tx_fee(x, base_currency) for x in buy_exchanges),
+            quote_balances=to_array(balance(x.name, quote_currency) for x in buy_exchanges),
+            base_balances=to_array(balance(x.name, base_currency) for x in sell_exchanges)
+        )
+
+    @staticmethod
+    def _profit_bounds(snapshot: MarketSnapshot) -> Tuple[np.ndarray, np.ndarray]:
+        """Computes an upper bound on the net profit of every (buy, sell) pairing from the top of
+        each order book, along with the order size it assumes. Rows correspond to buy exchanges
+        and columns to sell exchanges.
+
+        Walking deeper into the books only worsens both prices and can only shrink the order, so
+        no pairing can do better than trading its full buying power at the best ask and bid. Order
+        fees are left out since they depend on the size actually traded.
+        """
+        asks = snapshot.asks[:, None]
+        bids = snapshot.bids[None, :]
+        buy_power = snapshot.quote_balances[:, None] / (asks * 1.02)
+        max_order_size = np.minimum(buy_power, snapshot.base_balances[None, :])
+        return (bids - asks) * max_order_size - snapshot.tx_fees[:, None] * asks, max_order_size
 
-    def _find_best_arbitrage_opportunity(self, base_currency: str, update_table: bool = False):
+    def _find_best_arbitrage_opportunity(self, base_currency: str):
         best_opportunity = None
+        buy_exchanges, sell_exchanges = self._exchanges.trading_exchanges(base_currency)
+        if not buy_exchanges or not sell_exchanges:
+            self._last_profits.pop(base_currency, None)
+            return None
+
+        snapshot = self._snapshot_market(base_currency, buy_exchanges, sell_exchanges)
+        bounds, bound_sizes = self._profit_bounds(snapshot)
+        buy_names = np.array([x.name for x in buy_exchanges], dtype=object)
+        sell_names = np.array([x.name for x in sell_exchanges], dtype=object)
+        same_exchange = buy_names[:, None] == sell_names[None, :]
+        spreads = snapshot.bids[None, :] / snapshot.asks[:, None] - 1
+        fee_sums = snapshot.buy_fees[:, None] + snapshot.sell_fees[None, :]
+
+        # Profits kept for the arbitrage table. Every pair starts out with a top-of-book estimate
+        # (its bound less order fees), which is replaced by the exact figures if its books get walked
+        bound_costs = snapshot.asks[:, None] * bound_sizes
+        unpriced = same_exchange | ~(bound_costs > 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            estimates = bounds - fee_sums * bound_costs
+            profits = np.where(unpriced, np.nan, estimates)
+            percent_profits = np.where(unpriced, np.nan, estimates / bound_costs)
+        estimated = ~unpriced
+        self._last_profits[base_currency] = (buy_names, sell_names, profits, percent_profits, estimated)
+
+        # Deeper levels only worsen prices and order fees only grow with them, so a pair whose
+        # top-of-book spread doesn't cover its fees can never clear the profit threshold
+        max_quote_amt = self._exchanges.totals()[self.quote_currency] * Defaults.HI_BALANCE_PERCENT
+        thresholds = np.where(snapshot.quote_balances > max_quote_amt, 0., self._min_profit_threshold)
+        candidates = ~same_exchange & (spreads >= np.maximum(fee_sums + thresholds[:, None], 0.))
+
+        # Walk the books of the most promising pairs first, so that the search can stop as soon
+        # as no remaining pair could beat the best opportunity found so far
+        bounds[~candidates] = -np.inf
+        ranked_pairs = zip(*np.unravel_index(np.argsort(-bounds, axis=None), bounds.shape))
+
+        # Plain lists give fast scalar access (and Python floats) inside the loop
+        asks, _, buy_fees, sell_fees, tx_fees, quote_balances, base_balances = (x.tolist() for x in snapshot)
+        min_order_size = self._min_order_sizes[base_currency]
 
         # TODO: Don't find best, just check everything and execute if profitable
-        for buy_exchange, sell_exchange in product(self._exchanges.buy_exchanges(base_currency), self._exchanges.sell_exchanges(base_currency)):
-            if buy_exchange.name == sell_exchange.name:
-                if update_table:
-                    self._arbitrage_table.loc[buy_exchange.name, sell_exchange.name] = '-'
-                continue
+        for i, j in ranked_pairs:
+            if not candidates[i, j]:
+                break
+            if best_opportunity is not None and bounds[i, j] <= best_opportunity.net_profit:
+                break
 
-            estimated_buy_price = buy_exchange.ask(base_currency) * 1.02
+            buy_exchange, sell_exchange = buy_exchanges[i], sell_exchanges[j]
+
+            estimated_buy_price = asks[i] * 1.02
 
             # Calculate the maximum size of the order
-            buy_power = self._exchanges.balance(buy_exchange.name, self.quote_currency) / estimated_buy_price
-            sell_power = self._exchanges.balance(sell_exchange.name, base_currency)
+            buy_power = quote_balances[i] / estimated_buy_price
+            sell_power = base_balances[j]
             max_order_size = min(buy_power, sell_power)
 
-            order_spec = self._maximize_order_profit(buy_exchange, sell_exchange, base_currency, max_order_size)
+            order_spec = self._maximize_order_profit(buy_exchange, sell_exchange, base_currency, max_order_size, tx_fees[i])
+            # Walked pairs only show in the table if they come out as a viable order
+            estimated[i, j] = False
+            profits[i, j] = percent_profits[i, j] = np.nan
             buy_price, buy_limit_price, sell_price, sell_limit_price, order_size, _ = order_spec
+            if not order_size:
+                continue
 
             # TODO: move this somewhere that makes more sense
             # if base_currency in ['ETH', 'LTC']:
             #     if buy_exchange.name == 'kraken':
-            #         buy_price = float(format_floats(buy_price, 2))
+            #         buy_price = round(buy_price, 2)
             #     elif sell_exchange.name == 'kraken':
-            #         sell_price = float(format_floats(sell_price, 2))
+            #         sell_price = round(sell_price, 2)
             # elif base_currency == 'XRP':
             #     if buy_exchange.name == 'kraken':
-            #         buy_price = float(format_floats(buy_price, 5))
+            #         buy_price = round(buy_price, 5)
             #     elif sell_exchange.name == 'kraken':
-            #         sell_price = float(format_floats(sell_price, 5))
+            #         sell_price = round(sell_price, 5)
 
-            if sell_price < buy_price and not update_table:
+            if sell_price < buy_price:
                 continue
 
             # Calculate order fees
-            buy_fee = order_size * buy_price * buy_exchange.fee(base_currency, self.quote_currency)
-            sell_fee = order_size * sell_price * sell_exchange.fee(base_currency, self.quote_currency)
+            buy_fee = order_size * buy_price * buy_fees[i]
+            sell_fee = order_size * sell_price * sell_fees[j]
 
             # Adjust order size to account for fees
             if buy_power < sell_power:
@@ -135,7 +343,7 @@ class ArbitrageEngine(object):
             else:
                 order_size -= sell_fee / sell_price
 
-            if order_size < CURRENCIES[base_currency]['min_order_size'] and not update_table:
+            if order_size < min_order_size:
                 continue
 
             # Calculate gross profit
@@ -143,7 +351,7 @@ class ArbitrageEngine(object):
             gross_profit = gross_percent_profit * buy_price * order_size
 
             # Calculate transfer fees
-            buy_tx_fee = buy_exchange.tx_fee(base_currency) * buy_price
+            buy_tx_fee = tx_fees[i] * buy_price
             sell_tx_fee = 0.
             total_tx_fee = buy_tx_fee + sell_tx_fee
 
@@ -152,146 +360,124 @@ class ArbitrageEngine(object):
             net_profit = gross_profit - total_fees
             net_percent_profit = net_profit / (buy_price * order_size)
 
-            if best_opportunity is None or net_profit > best_opportunity['net_profit']:
+            if best_opportunity is None or net_profit > best_opportunity.net_profit:
                 # A lot of this info is for logging/debugging
-                best_opportunity = {
-                    'base_currency': base_currency,
-                    'quote_currency': self.quote_currency,
-                    'buy_exchange': buy_exchange.name,
-                    'buy_price': buy_price,
-                    'buy_limit_price': buy_limit_price,
-                    'sell_exchange': sell_exchange.name,
-                    'sell_price': sell_price,
-                    'sell_limit_price': sell_limit_price,
-                    'gross_percent_profit': gross_percent_profit,
-                    'net_percent_profit': net_percent_profit,
-                    'net_profit': net_profit,
-                    'gross_profit': gross_profit,
-                    'order_size': order_size,
-                    'total_tx_fee': total_tx_fee,
-                    'total_fees': total_fees,
-                    'buy_tx_fee': buy_tx_fee,
-                    'sell_tx_fee': sell_tx_fee,
-                    'buy_fee': buy_fee,
-                    'sell_fee': sell_fee,
-                    'buy_power': buy_power,
-                    'sell_power': sell_power
-                }
-
-            if update_table:
-                table_val = '{:.4f} {} ({:.2f}%)'.format(net_profit, self.quote_currency, net_percent_profit*100)
-                self._arbitrage_table.loc[buy_exchange.name, sell_exchange.name] = table_val
+                best_opportunity = Opportunity(
+                    base_currency=base_currency,
+                    quote_currency=self.quote_currency,
+                    buy_exchange=buy_exchange.name,
+                    buy_price=buy_price,
+                    buy_limit_price=buy_limit_price,
+                    sell_exchange=sell_exchange.name,
+                    sell_price=sell_price,
+                    sell_limit_price=sell_limit_price,
+                    gross_percent_profit=gross_percent_profit,
+                    net_percent_profit=net_percent_profit,
+                    net_profit=net_profit,
+                    gross_profit=gross_profit,
+                    order_size=order_size,
+                    total_tx_fee=total_tx_fee,
+                    total_fees=total_fees,
+                    buy_tx_fee=buy_tx_fee,
+                    sell_tx_fee=sell_tx_fee,
+                    buy_fee=buy_fee,
+                    sell_fee=sell_fee,
+                    buy_power=buy_power,
+                    sell_power=sell_power
+                )
+
+            profits[i, j] = net_profit
+            percent_profits[i, j] = net_percent_profit
 
         return best_opportunity
 
-    def _maximize_order_profit(self, buy_exchange, sell_exchange, base_currency: str, max_order_size: float) -> OrderSpec:
-        buffered_order_size = max_order_size * (1 + Defaults.ORDER_BOOK_BUFFER)
-        asks = iter(buy_exchange.get_asks(base_currency, self.quote_currency, buffered_order_size))
-        bids = iter(sell_exchange.get_bids(base_currency, self.quote_currency, buffered_order_size))
-        tx_fee = buy_exchange.tx_fee(base_currency)
-
-        # Use brute force solution then later improve if it is a bottleneck
-        ask_price, ask_size = next(asks)
-        bid_price, bid_size = next(bids)
-
-        # Take buffer off the top of the order book to make order success more likely
-        buffer_remaining = max_order_size * Defaults.ORDER_BOOK_BUFFER
-        while buffer_remaining > 0:
-            if buffer_remaining < min(ask_size, bid_size):
-                ask_size -= buffer_remaining
-                bid_size -= buffer_remaining
-                buffer_remaining = 0.
-            elif ask_size < bid_size:
-                buffer_remaining -= ask_size
-                bid_size -= ask_size
-                ask_price, ask_size = next(asks)
-            else:
-                buffer_remaining -= bid_size
-                ask_size -= bid_size
-                bid_price, bid_size = next(bids)
-
-        best_order = None
-        vol_remaining = max_order_size
-        total_size = 0.
-        ask_cost = bid_cost = 0.
+    def _profit_cells(self, base_currency: str) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Formats the profits recorded by the latest scan of the given currency as strings.
+        Pairs whose books weren't walked show their top-of-book estimate prefixed with '~'; pairs
+        with nothing to show (including an exchange paired with itself) are shown as '-'.
 
-        while vol_remaining > 0:
-            try:
-                if vol_remaining < min(ask_size, bid_size):
-                    ask_cost += ask_price * vol_remaining
-                    bid_cost += bid_price * vol_remaining
-                    total_size += vol_remaining
-                    vol_remaining = 0.
-                elif ask_size < bid_size:
-                    ask_cost += ask_price * ask_size
-                    bid_cost += bid_price * ask_size
-                    bid_size -= ask_size
-                    total_size += ask_size
-                    vol_remaining -= ask_size
-                    ask_price, ask_size = next(asks)
-                else:
-                    ask_cost += ask_price * bid_size
-                    bid_cost += bid_price * bid_size
-                    ask_size -= bid_size
-                    total_size += bid_size
-                    vol_remaining -= bid_size
-                    bid_price, bid_size = next(bids)
-
-                avg_ask = ask_cost / total_size
-                avg_bid = bid_cost / total_size
-
-                gross_profit = bid_cost - ask_cost
-                net_profit = gross_profit - (tx_fee * avg_ask)
-                net_percent_profit = net_profit / ask_cost
-
-                if best_order is None or net_percent_profit > best_order.profit:
-                    best_order = OrderSpec(avg_ask, ask_price, avg_bid, bid_price, total_size, net_percent_profit)
-
-            except StopIteration:
-                break
-
-        return best_order
-
-    def _should_execute(self,
-                        buy_exchange: str,
-                        sell_exchange: str,
-                        net_percent_profit: float,
-                        **kwargs) -> bool:
-        max_quote_amt = self._exchanges.totals()[self.quote_currency] * Defaults.HI_BALANCE_PERCENT
-
-        if self._exchanges.balances()[buy_exchange][self.quote_currency] > max_quote_amt:
-            return net_percent_profit > 0.
-
-        return net_percent_profit >= self._min_profit_threshold
-
-    def _execute_arbitrage(self,
-                           base_currency: str,
-                           quote_currency: str,
-                           buy_exchange: str,
-                           sell_exchange: str,
-                           buy_limit_price: float,
-                           sell_limit_price: float,
-                           order_size: float,
-                           total_tx_fee: float,
-                           net_percent_profit: float, **kwargs):
-        buy_exchange = self._exchanges.get(buy_exchange)
-        sell_exchange = self._exchanges.get(sell_exchange)
+        :returns: the buy exchange names, sell exchange names and cells, or None if there is no scan
+        """
+        if base_currency not in self._last_profits:
+            return None
+
+        buy_names, sell_names, profits, percent_profits, estimated = self._last_profits[base_currency]
+        cells = np.full(profits.shape, '-', dtype=object)
+        evaluated = ~np.isnan(profits)
+        if evaluated.any():
+            # Format every evaluated cell in one go rather than calling str.format per pair
+            cells[evaluated] = np.char.add(
+                np.char.add(np.char.add(np.where(estimated[evaluated], '~', ''),
+                                        np.char.mod('%.4f ' + self.quote_currency + ' (', profits[evaluated])),
+                            np.char.mod('%.2f', percent_profits[evaluated]*100)),
+                '%)')
+        return buy_names, sell_names, cells
+
+    def _profit_table(self, base_currency: str):
+        # Only arbitrage_table() builds a dataframe, so pandas is loaded on first use
+        import pandas as pd
+
+        profit_cells = self._profit_cells(base_currency)
+        if profit_cells is None:
+            return pd.DataFrame()
+        buy_names, sell_names, cells = profit_cells
+        return pd.DataFrame(cells, index=buy_names, columns=sell_names)
+
+    def _render_profit_table(self, base_currency: str) -> str:
+        """Lays out the profit cells as text for printing, without going through a dataframe."""
+        profit_cells = self._profit_cells(base_currency)
+        if profit_cells is None:
+            return ''
+        buy_names, sell_names, cells = profit_cells
+
+        rows = [['', *sell_names]] + [[name, *row] for name, row in zip(buy_names, cells.tolist())]
+        widths = [max(len(row[k]) for row in rows) for k in range(len(rows[0]))]
+        return '\n'.join(
+            '  '.join([row[0].ljust(widths[0])] + [cell.rjust(w) for cell, w in zip(row[1:], widths[1:])])
+            for row in rows
+        )
+
+    def _maximize_order_profit(self, buy_exchange, sell_exchange, base_currency: str, max_order_size: float,
+                               tx_fee: float) -> OrderSpec:
+        buffer_pct = Defaults.ORDER_BOOK_BUFFER
+        buffered_order_size = max_order_size * (1 + buffer_pct)
+        asks = buy_exchange.get_asks(base_currency, self.quote_currency, buffered_order_size)
+        bids = sell_exchange.get_bids(base_currency, self.quote_currency, buffered_order_size)
+        return OrderSpec(*_walk_books(_to_levels(asks), _to_levels(bids), max_order_size, buffer_pct, tx_fee))
+
+    def _should_execute(self, opportunity: Opportunity) -> bool:
+        quote_currency = self.quote_currency
+        max_quote_amt = self._exchanges.totals()[quote_currency] * Defaults.HI_BALANCE_PERCENT
+
+        # balance() reads the one entry needed rather than copying every exchange's balances
+        if self._exchanges.balance(opportunity.buy_exchange, quote_currency) > max_quote_amt:
+            return opportunity.net_percent_profit > 0.
+
+        return opportunity.net_percent_profit >= self._min_profit_threshold
+
+    def _execute_arbitrage(self, opportunity: Opportunity):
+        base_currency = opportunity.base_currency
+        quote_currency = opportunity.quote_currency
+        buy_limit_price = opportunity.buy_limit_price
+        sell_limit_price = opportunity.sell_limit_price
+        order_size = opportunity.order_size
+        buy_exchange = self._exchanges.get(opportunity.buy_exchange)
+        sell_exchange = self._exchanges.get(opportunity.sell_exchange)
 
         log_msg = ('Arbitrage opportunity: '
                    '{buy_exchange} buy {volume} {base_currency} @ {buy_limit_price}; '
                    '{sell_exchange} sell {volume} {base_currency} @ {sell_limit_price}; '
                    'profit: {profit:.2f}%')
-        event_data = {'buy_exchange': buy_exchange.name, 'sell_exchange': sell_exchange.name,
-                      'volume': order_size, 'base_currency': base_currency, 'quote_currency': quote_currency,
-                      'buy_limit_price': buy_limit_price, 'sell_limit_price': sell_limit_price, 'profit': net_percent_profit*100}
-        event_data.update(kwargs)
+        # Only reached for opportunities worth trading, so the full record is logged for debugging
+        event_data = opportunity._asdict()
+        event_data.update(volume=order_size, profit=opportunity.net_percent_profit*100)
         log.info(log_msg, event_name='arbitrage.attempt', event_data=event_data)
 
         if not self._is_dry_run and self._place_orders(base_currency, quote_currency, buy_exchange, sell_exchange, buy_limit_price,
                                                        sell_limit_price, order_size):
             self._exchanges.add_order('buy', buy_exchange.name)
             self._exchanges.add_order('sell', sell_exchange.name)
-            self._exchanges.tx_credits += total_tx_fee
+            self._exchanges.tx_credits += opportunity.total_tx_fee
             self._exchanges.update_trading_balances()
 
     def _place_orders(self,
@@ -320,16 +506,12 @@ class ArbitrageEngine(object):
                 log.error(e, event_name='place_order.error')
                 return None
 
-        buy_order = partial(place_order, buy_exchange, base_currency, 'buy', buy_limit_price, order_volume, quote_currency=quote_currency)
-        sell_order = partial(place_order, sell_exchange, base_currency, 'sell', sell_limit_price, order_volume, quote_currency=quote_currency)
-
-        # place orders asynchronously to avoid missing the target price
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            futures = [
-                self._loop.run_in_executor(executor, buy_order),
-                self._loop.run_in_executor(executor, sell_order)
-            ]
-            buy_resp, sell_resp = tuple(self._loop.run_until_complete(asyncio.gather(*futures)))
+        # place orders in parallel to avoid missing the target price
+        buy_future = self._order_executor.submit(place_order, buy_exchange, base_currency, 'buy', buy_limit_price,
+                                                 order_volume, quote_currency=quote_currency)
+        sell_future = self._order_executor.submit(place_order, sell_exchange, base_currency, 'sell', sell_limit_price,
+                                                  order_volume, quote_currency=quote_currency)
+        buy_resp, sell_resp = buy_future.result(), sell_future.result()
 
         if buy_resp and sell_resp:
             log.info('Both orders placed successfully', event_name='arbitrage.place_order.success',
@@ -337,7 +519,8 @@ class ArbitrageEngine(object):
             return True
         elif buy_resp or sell_resp:
             # Check if order went through despite exchange returning an error
-            last_totals = copy.deepcopy(self._exchanges.totals())
+            # totals() builds a fresh dict of floats, so no copy is needed
+            last_totals = self._exchanges.totals()
             self._exchanges.update_trading_balances()
             current_totals = self._exchanges.totals()
             base_cur_difference = abs(current_totals[base_currency] - last_totals[base_currency])
@@ -361,10 +544,11 @@ class ArbitrageEngine(object):
         """Creates a table where rows represent to the exchange to buy from, and columns
         represent the exchange to sell to. The entry in each cell represents the percent profit/loss
         that would result from buying at the "buy" exchange and selling at the "sell" exchange.
+        Pairs the scan didn't walk, because they couldn't beat their fees or the best pair, show an
+        estimate from the top of their order books, prefixed with '~'.
 
         :returns: a dataframe representing the current arbitrage table
         """
-        buy_exchanges = {x.name: x for x in self._exchanges.buy_exchanges(base_currency)}
-        sell_exchanges = {x.name: x for x in self._exchanges.sell_exchanges(base_currency)}
-        self._arbitrage_table = pd.DataFrame(index=buy_exchanges.keys(), columns=sell_exchanges.keys())
-        self._find_best_arbitrage_opportunity(base_currency, update_table=True)
+        self._find_best_arbitrage_opportunity(base_currency)
+        self._arbitrage_table = self._profit_table(base_currency)
+        return self._arbitrage_table
@@ -1,23 +1,28 @@
-from coinbitrage import settings
+from importlib import import_module
 
-from .bitstamp import BitstampClient as Bitstamp
-from .bitfinex import BitfinexClient as Bitfinex
-from .bittrex import BittrexClient as Bittrex
-from .coinbase import CoinbaseClient as Coinbase
-from .hitbtc import HitBtcClient as HitBtc
-from .kraken import KrakenClient as Kraken
-from .poloniex import PoloniexClient as Poloniex
+from coinbitrage import settings
 
 
+# Adapters are imported on first use so that only the configured exchanges' dependencies are loaded
 _exchange_map = {
-    'bitfinex': Bitfinex,
-    'bitstamp': Bitstamp,
-    'bittrex': Bittrex,
-    'coinbase': Coinbase,
-    'hitbtc': HitBtc,
-    'kraken': Kraken,
-    'poloniex': Poloniex
+    'bitfinex': ('.bitfinex', 'BitfinexClient'),
+    'bitstamp': ('.bitstamp', 'BitstampClient'),
+    'bittrex': ('.bittrex', 'BittrexClient'),
+    'coinbase': ('.coinbase', 'CoinbaseClient'),
+    'hitbtc': ('.hitbtc', 'HitBtcClient'),
+    'kraken': ('.kraken', 'KrakenClient'),
+    'poloniex': ('.poloniex', 'PoloniexClient')
 }
+_exchange_classes = {}
+
+
+def _exchange_class(name: str):
+    cls = _exchange_classes.get(name)
+    if cls is None:
+        module_path, class_name = _exchange_map[name]
+        cls = getattr(import_module(module_path, __name__), class_name)
+        _exchange_classes[name] = cls
+    return cls
 
 
 def get_exchange(name: str):
@@ -32,4 +37,4 @@ def get_exchange(name: str):
     if name == 'coinbase':
         kwargs['gdax_key_file'] = str(settings.API_KEY_DIR/'gdax.key')
 
-    return _exchange_map[name](api_key, **kwargs)
+    return _exchange_class(name)(api_key, **kwargs)
@@ -1,7 +1,10 @@
+import json
+import logging
 import time
 from functools import wraps
 from typing import Any, Callable, Optional, Tuple
 
+import orjson
 from requests.exceptions import HTTPError, RequestException
 
 from coinbitrage import bitlogging
@@ -15,6 +18,18 @@ from .formatter import BaseFormatter
 log = bitlogging.getLogger(__name__)
 
 
+def _parse_json(resp) -> Any:
+    """Parse a response body with orjson, which is considerably faster than requests' stdlib-based
+    json(). Bodies orjson rejects but the stdlib accepts (e.g. ones starting with a UTF-8 BOM) fall
+    back to the stdlib parser. Note that orjson reads integers wider than 64 bits as floats rather than
+    failing, so such values lose precision; none of the exchange fields we read are that large.
+    """
+    try:
+        return orjson.loads(resp.content)
+    except orjson.JSONDecodeError:
+        return json.loads(resp.content)
+
+
 class BaseExchangeAPI(object):
     """An exchange's REST API. Handles making requests, formatting responses, parsing errors
     and raising them.
@@ -31,15 +46,22 @@ class BaseExchangeAPI(object):
         :param func: the function to wrap
         :param format_resp: if set to false, the response is not formatted at all and just the parsed JSON is returned
         """
+        # Resolved once here instead of on every call
+        method = func.__name__
+        formatter = getattr(self.formatter, method) if format_resp else None
+        float_precision = self.float_precision
+
         @wraps(func)
         def wrapped(*args, **kwargs):
-            args = format_floats(args, self.float_precision)
-            kwargs = format_floats(kwargs, self.float_precision)
+            args = format_floats(args, float_precision)
+            kwargs = format_floats(kwargs, float_precision)
 
-            log.debug('API call -- {exchange}.{method}{log_args}',
-                      event_name='exchange_api.call',
-                      event_data={'exchange': self.name, 'method': func.__name__, 'args': args,
-                                  'kwargs': kwargs, 'log_args': format_log_args(args, kwargs)})
+            # Skip building the event data altogether unless debug logging is on
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug('API call -- {exchange}.{method}{log_args}',
+                          event_name='exchange_api.call',
+                          event_data={'exchange': self.name, 'method': method, 'args': args,
+                                      'kwargs': kwargs, 'log_args': format_log_args(args, kwargs)})
 
             try:
                 resp = func(*args, **kwargs)
@@ -50,11 +72,11 @@ class BaseExchangeAPI(object):
                 resp.raise_for_status()
             except HTTPError as e:
                 log_msg = '{exchange}.{method}{log_args} encountered an HTTP error ({status_code})'
-                event_data = {'exchange': self.name, 'status_code': resp.status_code, 'method': func.__name__,
+                event_data = {'exchange': self.name, 'status_code': resp.status_code, 'method': method,
                               'log_args': format_log_args(args, kwargs), 'args': args, 'kwargs': kwargs}
-                if 'application/json' in resp.headers['Content-Type']:
+                if 'application/json' in resp.headers.get('Content-Type', ''):
                     log_msg += ': {error_message}'
-                    event_data['error_message'] = resp.json()
+                    event_data['error_message'] = _parse_json(resp)
                 if resp.status_code >= 400 and resp.status_code < 500:
                     log.error(log_msg, event_name='exchange_api.http_error.client', event_data=event_data)
                     raise ClientError(e)
@@ -62,12 +84,11 @@ class BaseExchangeAPI(object):
                     log.warning(log_msg, event_name='exchange_api.http_error.server', event_data=event_data)
                     raise ServerError(e)
 
-            resp_data = resp.json()
+            resp_data = _parse_json(resp)
             self.raise_for_exchange_error(resp_data)
 
             # Return formatted response
             if format_resp:
-                formatter = getattr(self.formatter, func.__name__)
                 return formatter(resp.formatted) if resp.formatted else formatter(resp_data)
 
             # Return parsed JSON
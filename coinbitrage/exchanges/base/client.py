@@ -15,7 +15,7 @@ class BaseExchangeClient(object):
 
     def __init__(self, key_file: str, **kwargs):
         self.api = self._api_class(self.name, key_file, **kwargs)
-        self.supported_pairs = []
+        self.supported_pairs = set()
         self.currency_info = {}
         self.breaker_tripped = None
 
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Tuple
 
 from coinbitrage import bitlogging
@@ -7,15 +8,33 @@ from coinbitrage.settings import CURRENCIES
 log = bitlogging.getLogger(__name__)
 
 
+def _identity(x):
+    return x
+
+
 class BaseFormatter(object):
     _currency_map = {}
 
     def __init__(self, pair_delimiter=''):
         self._pair_delimiter = pair_delimiter
         self._inverse_currency_map = {v: k for k, v in self._currency_map.items()}
+        # Currency codes as they may appear in an undelimited pair
+        self._known_currencies = frozenset(CURRENCIES) | frozenset(self._currency_map.values())
+        # Currency maps are fixed and only a handful of currencies/pairs are ever formatted, so
+        # results are memoized per instance (wrapping whichever override a subclass defines)
+        self.format = lru_cache(maxsize=None)(self.format)
+        self.pair = lru_cache(maxsize=None)(self.pair)
+        self.unpair = lru_cache(maxsize=None)(self.unpair)
 
     def __getattr__(self, name):
-        return lambda x: x
+        # Only API method names get the pass-through; private and special names (copy/pickle
+        # hooks, attributes read before __init__ has run) must fail as usual
+        if name.startswith('_'):
+            raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+        # Responses without a dedicated formatter are returned as-is. Caching the identity
+        # function on the instance means later lookups don't come back through here
+        setattr(self, name, _identity)
+        return _identity
 
     def format(self, currency: str, inverse: bool = False) -> str:
         currency = currency.upper()
@@ -31,10 +50,22 @@ class BaseFormatter(object):
         if self._pair_delimiter:
             base, quote = tuple(currency_pair.split(self._pair_delimiter))
         else:
-            mid = len(currency_pair) // 2
-            base, quote = currency_pair[:mid], currency_pair[mid:]
-            if len(currency_pair) % 2 != 0 and not (base in CURRENCIES and quote in CURRENCIES):
-                base, quote = currency_pair[:mid+1], currency_pair[mid+1:]
+            base, quote = self._split_pair(currency_pair)
         base = self.format(base, inverse=True)
         quote = self.format(quote, inverse=True)
         return base, quote
+
+    def _split_pair(self, currency_pair: str) -> Tuple[str, str]:
+        """Splits an undelimited pair where both halves are known currencies (so that e.g.
+        DASHBTC becomes DASH/BTC), falling back to splitting it in the middle.
+        """
+        for i in range(1, len(currency_pair)):
+            base, quote = currency_pair[:i], currency_pair[i:]
+            if base in self._known_currencies and quote in self._known_currencies:
+                return base, quote
+
+        mid = len(currency_pair) // 2
+        base, quote = currency_pair[:mid], currency_pair[mid:]
+        if len(currency_pair) % 2 != 0 and not (base in CURRENCIES and quote in CURRENCIES):
+            base, quote = currency_pair[:mid+1], currency_pair[mid+1:]
+        return base, quote
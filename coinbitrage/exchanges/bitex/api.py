@@ -1,8 +1,11 @@
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import asyncio
+import requests
+from bitex.api.REST.response import APIResponse
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, ConnectTimeout, RequestException, ReadTimeout, Timeout
 
 from coinbitrage import bitlogging
@@ -17,6 +20,18 @@ from .formatter import BitExFormatter
 log = bitlogging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _http_session() -> requests.Session:
+    """The keep-alive session shared by all BitEx adapters. Its pool keeps a set of connections
+    per exchange host, so concurrent calls to one exchange don't open throwaway connections.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=Defaults.HTTP_POOL_SIZE, pool_maxsize=Defaults.HTTP_POOL_SIZE)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class BitExAPIAdapter(BaseExchangeAPI):
     """Class for implementing REST API adapters using the BitEx library."""
     _api_class = None
@@ -26,13 +41,27 @@ class BitExAPIAdapter(BaseExchangeAPI):
         super(BitExAPIAdapter, self).__init__(name)
         self._api = self._api_class(key_file=key_file, timeout=timeout)
 
+        # BitEx opens a new connection for every request; sending them through a shared session
+        # keeps connections (and their TLS handshakes) alive between calls
+        self._session = _http_session()
+        self._api.api_request = self._api_request
+
     def __getattr__(self, name: str):
         attr = getattr(self._api, name)
         if not callable(attr):
             return attr
-        return retry_on_exception(ServerError, ConnectTimeout)(self._wrap(attr))
+        # Cached on the instance so that later calls skip both __getattr__ and the wrapping
+        wrapped = retry_on_exception(ServerError, ConnectTimeout)(self._wrap(attr))
+        setattr(self, name, wrapped)
+        return wrapped
+
+    def _api_request(self, *args, **kwargs) -> APIResponse:
+        return APIResponse(self._session.request(*args, **kwargs))
 
     def _wrap(self, func: Callable[[Any], Any], format_resp: bool = True) -> Any:
+        # Built once per wrap rather than on every call
+        wrapped = super(BitExAPIAdapter, self)._wrap(func, format_resp=format_resp)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Format args as expected by Bitex
@@ -44,7 +73,7 @@ class BitExAPIAdapter(BaseExchangeAPI):
             elif 'currency' in kwargs:
                 currency = kwargs.pop('currency')
                 kwargs['currency'] = self.formatter.format(currency)
-            return super(BitExAPIAdapter, self)._wrap(func, format_resp=format_resp)(*args, **kwargs)
+            return wrapped(*args, **kwargs)
         return wrapper
 
     @retry_on_exception(ServerError, Timeout)
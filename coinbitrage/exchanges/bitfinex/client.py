@@ -15,7 +15,7 @@ class BitfinexClient(BaseExchangeClient, WebsocketOrderBookMixin):
         WebsocketOrderBookMixin.__init__(self)
 
     def init(self):
-        self.supported_pairs = self.api.pairs()
+        self.supported_pairs = set(self.api.pairs())
         self.currency_info = {
             cur: {'tx_fee': float(fee)} for cur, fee in self.api.withdraw_fees()['withdraw'].items()
         }
@@ -3,9 +3,8 @@ from collections import defaultdict
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from functools import partial
-from typing import Dict, List, Union
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
 
-import asyncio
 from requests.exceptions import RequestException, Timeout
 
 from coinbitrage import bitlogging
@@ -26,16 +25,20 @@ class ExchangeManager(object):
                  exchanges: List[str],
                  base_currency: Union[str, List[str]],
                  quote_currency: str,
-                 loop = None,
                  initial_tx_credit: float = 0.):
         self.base_currencies = base_currency if isinstance(base_currency, list) else [base_currency]
         self.quote_currency = quote_currency
         self.tx_credits = initial_tx_credit  # In quote currency
         self.all_currencies = self.base_currencies + [quote_currency]
-        self._loop = loop or asyncio.get_event_loop()
+        self._all_currency_set = frozenset(self.all_currencies)
         self._balances = {}
         self._clients = {}
         self._order_history = defaultdict(list)
+        self._generation = 0
+        self._pair_exchanges = {}
+        self._fee_cache = {}
+        # Kept for the manager's lifetime so that each fan-out reuses warm threads
+        self._executor = ThreadPoolExecutor(max_workers=max(len(exchanges), 1), thread_name_prefix='exchange')
         self._init_clients([get_exchange(name) for name in exchanges])
         self.update_trading_balances()
 
@@ -43,9 +46,7 @@ class ExchangeManager(object):
     # to a single address
 
     def _init_clients(self, clients: list):
-        with ThreadPoolExecutor(max_workers=len(clients)) as executor:
-            futures = [self._loop.run_in_executor(executor, exchg.init) for exchg in clients]
-            self._loop.run_until_complete(asyncio.gather(*futures))
+        self._map_threaded(lambda exchg: exchg.init(), clients)
 
         self._clients = {
             exchg.name: exchg for exchg in clients
@@ -53,11 +54,17 @@ class ExchangeManager(object):
         }
 
     @contextmanager
-    def live_updates(self):
+    def live_updates(self, on_update: Callable[[str], None] = None):
         """A context manager for opening and closing resources associated with
-        exchanges."""
+        exchanges.
+
+        :param on_update: called with the pair whenever an exchange's order book changes
+        """
         try:
             for exchange in self.exchanges:
+                on_book_update = getattr(exchange, 'on_book_update', None)
+                if on_update and on_book_update:
+                    on_book_update(on_update)
                 exchange.start_live_updates(self.base_currencies, self.quote_currency)
             yield
         finally:
@@ -71,10 +78,12 @@ class ExchangeManager(object):
         return self._balances[exchange][currency]
 
     def balances(self, full: bool = False):
+        # Exchanges report balances in every currency they list, so test membership against a set
+        currencies = self._all_currency_set
         return {
             exchg: {
                 cur: bal for cur, bal in bals.items()
-                if full or cur in self.all_currencies
+                if full or cur in currencies
             } for exchg, bals in self._balances.items()
         }
 
@@ -98,38 +107,77 @@ class ExchangeManager(object):
                  event_data={'totals': self.totals()})
         self._pre_distribute_step()
         self.update_trading_balances()
+        transferred = False
         for currency in self.base_currencies:
-            self._redistribute_base(currency)
+            transferred |= self._redistribute_base(currency)
         # self._redistribute_quote()
-        self.update_trading_balances()
+        # Balances only need fetching again if funds actually moved
+        if transferred:
+            self.update_trading_balances()
         self._pre_trading_step()
-
-
-    def buy_exchanges(self, base_currency: str):
-        def buy_exchange_filter(exchange):
-            return all([
-                # Supports this trading pair
-                exchange.supports_pair(base_currency, self.quote_currency),
-                # Balance is above minimum
-                self._balances[exchange.name].get(self.quote_currency, 0.) >= CURRENCIES[self.quote_currency]['min_order_size'],
-                # Has been updated recently
-                exchange.updated_recently(base_currency, self.quote_currency, Defaults.STALE_DATA_TIMEOUT)
-            ])
-
-        return filter(buy_exchange_filter, self.exchanges)
-
-    def sell_exchanges(self, base_currency: str):
-        def sell_exchange_filter(exchange):
-            return all([
-                # Supports this trading pair
-                exchange.supports_pair(base_currency, self.quote_currency),
-                # Balance is above minimum
-                self._balances[exchange.name].get(base_currency, 0.) >= CURRENCIES[base_currency]['min_order_size'],
-                # Has been updated recently
-                exchange.updated_recently(base_currency, self.quote_currency, Defaults.STALE_DATA_TIMEOUT)
-            ])
-
-        return filter(sell_exchange_filter, self.exchanges)
+        self._generation += 1
+
+    def _pair_exchanges_for(self, base_currency: str) -> list:
+        """Returns the active exchanges that trade the given base currency against the quote
+        currency. Pair support is memoized until the next call to `manage_exchanges`.
+        """
+        generation, supporters = self._pair_exchanges.get(base_currency, (None, None))
+        if generation != self._generation:
+            supporters = [x for x in self._clients.values() if x.supports_pair(base_currency, self.quote_currency)]
+            self._pair_exchanges[base_currency] = (self._generation, supporters)
+        return [x for x in supporters if not x.breaker_tripped]
+
+    def buy_exchanges(self, base_currency: str) -> list:
+        return self.trading_exchanges(base_currency)[0]
+
+    def sell_exchanges(self, base_currency: str) -> list:
+        return self.trading_exchanges(base_currency)[1]
+
+    def fee(self, exchange, base_currency: str) -> float:
+        """Returns the exchange's order fee for the given base currency against the quote currency.
+        Memoized until the next call to `manage_exchanges`.
+        """
+        return self._memoized_fee('fee', exchange, base_currency,
+                                  lambda: exchange.fee(base_currency, self.quote_currency))
+
+    def tx_fee(self, exchange, base_currency: str) -> float:
+        """Returns the exchange's transfer fee for the given base currency. Memoized until the next
+        call to `manage_exchanges`.
+        """
+        return self._memoized_fee('tx_fee', exchange, base_currency, lambda: exchange.tx_fee(base_currency))
+
+    def _memoized_fee(self, kind: str, exchange, base_currency: str, get_fee: Callable[[], float]) -> float:
+        key = (kind, exchange.name, base_currency)
+        generation, fee = self._fee_cache.get(key, (None, None))
+        if generation != self._generation:
+            fee = get_fee()
+            self._fee_cache[key] = (self._generation, fee)
+        return fee
+
+    def trading_exchanges(self, base_currency: str) -> Tuple[list, list]:
+        """Returns the exchanges to buy from (those with enough quote currency) and to sell to (those
+        with enough base currency), keeping only those whose order books are fresh. Done in a single
+        pass that checks each order book's freshness only once.
+        """
+        quote_currency = self.quote_currency
+        min_quote_balance = CURRENCIES[quote_currency]['min_order_size']
+        min_base_balance = CURRENCIES[base_currency]['min_order_size']
+        balances = self._balances
+
+        buys, sells = [], []
+        for exchange in self._pair_exchanges_for(base_currency):
+            exchange_balances = balances[exchange.name]
+            can_buy = exchange_balances.get(quote_currency, 0.) >= min_quote_balance
+            can_sell = exchange_balances.get(base_currency, 0.) >= min_base_balance
+            if not (can_buy or can_sell):
+                continue
+            if not exchange.updated_recently(base_currency, quote_currency, Defaults.STALE_DATA_TIMEOUT):
+                continue
+            if can_buy:
+                buys.append(exchange)
+            if can_sell:
+                sells.append(exchange)
+        return buys, sells
 
     def add_order(self, side: str, exchange_name: str):
         self._order_history[side].append({'exchange': exchange_name, 'time': time.time()})
@@ -178,23 +226,23 @@ class ExchangeManager(object):
                         except RequestException:
                             pass
 
-        futures = [
-            self._loop.run_in_executor(None, bank_to_trading, exchg)
-            for exchg in filtered_exchanges
-        ]
-        self._loop.run_until_complete(asyncio.gather(*futures))
+        self._map_threaded(bank_to_trading, filtered_exchanges)
 
     def _exchange_proxy_currencies(self):
         filtered_exchanges = filter(lambda x: isinstance(x.api, ProxyCurrencyWrapper), self.exchanges)
-        futures = [self._loop.run_in_executor(None, exchg.proxy_to_quote) for exchg in filtered_exchanges]
-        self._loop.run_until_complete(asyncio.gather(*futures))
+        self._map_threaded(lambda exchg: exchg.proxy_to_quote(), filtered_exchanges)
+
+    def _redistribute_base(self, currency: str) -> bool:
+        """Moves some of `currency` from the exchange holding the most of it to the one paying
+        the best price for it.
 
-    def _redistribute_base(self, currency: str):
+        :returns: whether a transfer was made
+        """
         # TODO: revisit this strategy and determine if it makes sense
 
         total_bal = self.totals().get(currency)
         if not total_bal:
-            return
+            return False
         target_bal = total_bal / len(self._clients)
 
         initialized_exchanges = filter(lambda x: x.order_book_initialized(currency, self.quote_currency), self.exchanges)
@@ -207,25 +255,26 @@ class ExchangeManager(object):
         highest_balance = self.get(hi_bal_name)
 
         if best_price.name == highest_balance.name or lo_bal >= hi_bal:
-            return
+            return False
 
         transfer_amt = max(hi_bal - target_bal, target_bal - lo_bal)
 
         if transfer_amt <= CURRENCIES[currency]['min_order_size']:
-            return
+            return False
 
         tx_fee = highest_balance.tx_fee(currency) * highest_balance.bid(currency)
         if tx_fee > self.tx_credits:
-            return
+            return False
 
         try:
             if best_price.get_funds_from(highest_balance, currency, transfer_amt):
                 self.tx_credits -= tx_fee
+                return True
         except (ClientError, ServerError, RequestException, Timeout) as e:
             log.info('Encountered error while trying to rebalance funds',
                      event_name='rebalance_base.failure',
                      event_data={'error': e})
-            return
+        return False
 
     # TODO: implement redistribution of quote currency only when there is a
     # severe imbalance (and it is possible to rebalance)
@@ -281,15 +330,16 @@ class ExchangeManager(object):
                 exchange.trip_circuit_breaker(RequestException, partial(exchange.balance))
                 return None
 
-        with ThreadPoolExecutor(max_workers=len(self._clients)) as executor:
-            futures = [
-                self._loop.run_in_executor(executor, get_balance, exchg)
-                for exchg in self.exchanges
-            ]
-            results = self._loop.run_until_complete(asyncio.gather(*futures))
+        results = self._map_threaded(get_balance, self.exchanges)
 
         self._balances = {
             name: {
                 cur: bal for cur, bal in balances.items()
             } for name, balances in filter(None, results)
         }
+
+    def _map_threaded(self, func: Callable[[Any], Any], items: Iterable[Any]) -> list:
+        """Calls `func` on every item at once on the manager's thread pool and returns the results
+        in order. Re-raises the first exception raised by any of the calls.
+        """
+        return list(self._executor.map(func, items))
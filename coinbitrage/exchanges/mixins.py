@@ -1,11 +1,11 @@
-import copy
 import logging
 import time
 from collections import defaultdict
 from functools import partial, wraps
 from threading import Event, RLock, Thread
-from typing import Dict, Iterable, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Union
 
+import numpy as np
 from requests.exceptions import RequestException
 
 from coinbitrage import bitlogging
@@ -45,11 +45,11 @@ class _OrderBookMixin(object):
         pair = self.formatter.pair(base_currency, quote_currency)
         return self._book.best_ask(pair)
 
-    def get_bids(self, base_currency: str, quote_currency: str, max_volume: float) -> List[Tuple[float, float]]:
+    def get_bids(self, base_currency: str, quote_currency: str, max_volume: float) -> np.ndarray:
         pair = self.formatter.pair(base_currency, quote_currency)
         return self._book.get_bids(pair, max_volume)
 
-    def get_asks(self, base_currency: str, quote_currency: str, max_volume: float) -> List[Tuple[float, float]]:
+    def get_asks(self, base_currency: str, quote_currency: str, max_volume: float) -> np.ndarray:
         pair = self.formatter.pair(base_currency, quote_currency)
         return self._book.get_asks(pair, max_volume)
 
@@ -61,6 +61,9 @@ class _OrderBookMixin(object):
         pair = self.formatter.pair(base_currency, quote_currency)
         return self._book.initialized(pair)
 
+    def on_book_update(self, callback: Callable[[str], None]):
+        self._book.add_listener(callback)
+
 
 class _WebsocketMixin(object):
     _channel = None
@@ -171,13 +174,11 @@ class RefreshTickerMixin(_RefreshMixin, _TickerMixin):
                                   'bid_ask': format_floats(bid_ask)})
 
     def bid_ask(self, base_currency: Optional[str] = None, quote_currency: str = Defaults.QUOTE_CURRENCY):
+        # Quotes only hold floats, so a shallow copy of each is enough to detach it from updates
         with self._lock:
             if base_currency:
-                ret = self._bid_ask.get(base_currency, {'bid': None, 'ask': None, 'time': None})
-            else:
-                ret = self._bid_ask
-
-            return copy.deepcopy(ret)
+                return dict(self._bid_ask.get(base_currency, {'bid': None, 'ask': None, 'time': None}))
+            return {currency: dict(quote) for currency, quote in self._bid_ask.items()}
 
 
 class RefreshOrderBookMixin(_RefreshMixin, _OrderBookMixin):
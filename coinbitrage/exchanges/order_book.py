@@ -1,8 +1,9 @@
 import time
 from collections import defaultdict, namedtuple
 from threading import Event, RLock
-from typing import Iterable, List, Optional, Tuple
+from typing import Callable, Iterable, Optional
 
+import numpy as np
 from bintrees import FastRBTree
 from pylimitbook.book import Book
 from pylimitbook.settings import PRICE_PRECISION
@@ -25,6 +26,11 @@ class OrderBook(object):
         self._initialized = defaultdict(Event)
         self._books = {}
         self._next_sequence = {}
+        self._listeners = []
+
+    def add_listener(self, callback: Callable[[str], None]):
+        """Registers a callback to be called with the pair after each applied update."""
+        self._listeners.append(callback)
 
     def update(self, full_update: OrderBookUpdate):
         with self._lock:
@@ -43,6 +49,9 @@ class OrderBook(object):
                           event_data={'received_sequence': received_seq, 'expected_sequence': expected_seq})
                 raise OrderBookUpdateError('Recieved messages out of order')
 
+        for callback in self._listeners:
+            callback(pair)
+
     def _initialize(self, pair: str, data: dict):
         self._books[pair] = Book()
 
@@ -61,7 +70,10 @@ class OrderBook(object):
     def _trade(self, pair: str, data: dict):
         pass
 
-    def _get_book_side(self, is_bid: bool, pair: str, max_volume: float = None) -> List[Tuple[float, float]]:
+    def _get_book_side(self, is_bid: bool, pair: str, max_volume: float = None) -> np.ndarray:
+        """Returns the (price, volume) levels on one side of the book, best first, as a (k, 2)
+        array. If `max_volume` is given, only the levels needed to fill it are included.
+        """
         with self._lock:
             tree = self._books[pair].bids.price_tree if is_bid else self._books[pair].asks.price_tree
             if max_volume is None:
@@ -76,12 +88,16 @@ class OrderBook(object):
                 end = price+1 if not is_bid else None
                 ret = tree.item_slice(start, end, is_bid)
 
-            return [(self._format_price(price), orders.volume) for price, orders in ret]
+            levels = np.array([(price, orders.volume) for price, orders in ret], dtype=np.float64)
+
+        levels = levels.reshape(-1, 2)
+        levels[:, 0] /= 10**PRICE_PRECISION
+        return levels
 
-    def get_bids(self, pair: str, max_volume: float) -> List[Tuple[float, float]]:
+    def get_bids(self, pair: str, max_volume: float) -> np.ndarray:
         return self._get_book_side(True, pair, max_volume)
 
-    def get_asks(self, pair: str, max_volume: float = None) -> List[Tuple[float, float]]:
+    def get_asks(self, pair: str, max_volume: float = None) -> np.ndarray:
         return self._get_book_side(False, pair, max_volume)
 
     def updated_recently(self, pair: str, seconds: int) -> bool:
@@ -14,6 +14,11 @@ from autobahn.asyncio.websocket import WampWebSocketClientFactory, WampWebSocket
 from autobahn.wamp.types import ComponentConfig
 from websocket import WebSocketApp, WebSocketException, WebSocketTimeoutException, create_connection
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 from coinbitrage import bitlogging
 from coinbitrage.exchanges.interfaces import WebsocketInterface
 from coinbitrage.exchanges.order_book import OrderBook
@@ -210,12 +215,15 @@ class WampWebsocket(BaseWebsocket):
         self._websocket_loop = None
 
     def _start_websocket(self):
-        self._websocket_loop = asyncio.new_event_loop()
+        # uvloop's libuv-based loop has much cheaper socket callbacks; use it when installed
+        self._websocket_loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
         super(WampWebsocket, self)._start_websocket()
 
     def _stop_websocket(self):
-        if self._websocket_loop:
-            self._websocket_loop.stop()
+        loop = self._websocket_loop
+        if loop and not loop.is_closed():
+            # The loop runs on the websocket thread, so it has to be told to stop from there
+            loop.call_soon_threadsafe(loop.stop)
         super(WampWebsocket, self)._stop_websocket()
 
     def _websocket(self, *args):
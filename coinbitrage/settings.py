@@ -69,6 +69,7 @@ class Defaults(object):
     FILL_ORDER_TIMEOUT = 60
     FLOAT_PRECISION = 9
     HI_BALANCE_PERCENT = 0.9
+    HTTP_POOL_SIZE = 16
     HTTP_TIMEOUT = 20
     MIN_PROFIT = 0.0075
     ORDER_BOOK_BUFFER = 0.25
@@ -14,17 +14,25 @@ from coinbitrage.settings import Defaults
 log = bitlogging.getLogger(__name__)
 
 
+_FORMATTED_TYPES = (float, list, set, tuple, dict)
+
+
 def format_floats(value, precision: int = Defaults.FLOAT_PRECISION):
     if isinstance(value, float):
         return f'{value:.{precision}f}'
-    elif isinstance(value, list):
-        return [format_floats(v) for v in value]
-    elif isinstance(value, set):
-        return {format_floats(v) for v in value}
-    elif isinstance(value, tuple):
-        return tuple(format_floats(v) for v in value)
     elif isinstance(value, dict):
+        # Most API calls pass no floats at all, in which case there is nothing to rebuild
+        if not any(isinstance(v, _FORMATTED_TYPES) for v in value.values()):
+            return value
         return {k: format_floats(v) for k, v in value.items()}
+    elif isinstance(value, (list, set, tuple)):
+        if not any(isinstance(v, _FORMATTED_TYPES) for v in value):
+            return value
+        if isinstance(value, list):
+            return [format_floats(v) for v in value]
+        elif isinstance(value, set):
+            return {format_floats(v) for v in value}
+        return tuple(format_floats(v) for v in value)
     else:
         return value
 
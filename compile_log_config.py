@@ -0,0 +1,27 @@
+"""Compiles log_config.yaml into coinbitrage/bitlogging/_config.py.
+
+Run automatically by `setup.py build_py`. bitlogging.configure() prefers the compiled module over
+the YAML file, unless the YAML file has been edited since it was compiled.
+"""
+import pprint
+from pathlib import Path
+
+import yaml
+
+
+ROOT = Path(__file__).resolve().parent
+SOURCE = ROOT/'log_config.yaml'
+TARGET = ROOT/'coinbitrage'/'bitlogging'/'_config.py'
+
+
+def main():
+    with SOURCE.open('rt') as f:
+        config = yaml.safe_load(f)
+
+    with TARGET.open('wt') as f:
+        f.write('# Generated from {} by {}; do not edit\n\n'.format(SOURCE.name, Path(__file__).name))
+        f.write('CONFIG = {}\n'.format(pprint.pformat(config)))
+
+
+if __name__ == '__main__':
+    main()
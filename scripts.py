@@ -3,7 +3,7 @@ import logging
 import os
 
 from coinbitrage import bitlogging
-from coinbitrage.engine import ArbitrageEngine
+from coinbitrage.engine import ArbitrageEngine, compile_kernels
 from coinbitrage.exchanges import get_exchange
 from coinbitrage.exchanges.manager import ExchangeManager
 from coinbitrage.settings import CURRENCIES, EXCHANGES, INACTIVE_EXCHANGES, Defaults
@@ -33,6 +33,11 @@ def run(verbose: bool, **kwargs):
     engine.run(verbose)
 
 
+@coin.command()
+def warmup():
+    compile_kernels()
+
+
 @coin.command()
 @click.option('--base-currency', default=Defaults.BASE_CURRENCIES)
 @click.option('--quote-currency', type=click.Choice(CURRENCIES.keys()), default=Defaults.QUOTE_CURRENCY)
@@ -1,4 +1,15 @@
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+
+
+class BuildPy(build_py):
+
+    def run(self):
+        # Imported here as it needs PyYAML, which is only a build requirement (see pyproject.toml)
+        import compile_log_config
+        compile_log_config.main()
+        super(BuildPy, self).run()
+
 
 def get_requirements_from_file(filepath):
     requires = []
@@ -11,6 +22,7 @@ setup(
     version='0.1',
     packages=find_packages(),
     install_requires=get_requirements_from_file('requirements.txt'),
+    cmdclass={'build_py': BuildPy},
     entry_points='''
         [console_scripts]
         coin=scripts:coin
@@ -0,0 +1,66 @@
+import logging
+import queue
+from logging.handlers import MemoryHandler, QueueListener
+
+import orjson
+
+from coinbitrage import bitlogging
+from coinbitrage.bitlogging.adapters import BitLoggerAdapter
+from coinbitrage.bitlogging.formatters import JSONFormatter
+
+
+class _ListHandler(logging.Handler):
+
+    def __init__(self):
+        super(_ListHandler, self).__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def _logger(name: str):
+    handler = _ListHandler()
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.handlers = [handler]
+    return BitLoggerAdapter(logger), handler
+
+
+def test_json_formatter_includes_exception_traceback():
+    log, handler = _logger('test.bitlogging.exception')
+    try:
+        raise ValueError('boom')
+    except ValueError as e:
+        log.exception(e, event_name='test.error')
+
+    line = orjson.loads(JSONFormatter().format(handler.records[0]))
+    assert line['message'] == 'boom'
+    assert 'Traceback (most recent call last)' in line['exc_text']
+    assert 'ValueError: boom' in line['exc_text']
+
+
+def test_lazy_message_falls_back_to_template_on_bad_format_spec():
+    log, handler = _logger('test.bitlogging.format_spec')
+    log.info('Price is {price:.2f}', event_name='test.price', event_data={'price': None})
+
+    record = handler.records[0]
+    assert record.getMessage() == 'Price is {price:.2f}'
+    line = orjson.loads(JSONFormatter().format(record))
+    assert line['message'] == 'Price is {price:.2f}'
+    assert line['event_data'] == {'price': None}
+
+
+def test_flush_writes_out_buffered_records():
+    target = _ListHandler()
+    buffer = MemoryHandler(capacity=512, flushLevel=logging.ERROR, target=target)
+    buffer.handle(logging.makeLogRecord({'msg': 'balance updated', 'levelno': logging.INFO}))
+    assert target.records == []
+
+    bitlogging._listeners.append(QueueListener(queue.SimpleQueue(), buffer))
+    try:
+        bitlogging.flush()
+    finally:
+        bitlogging._listeners.pop()
+    assert [r.msg for r in target.records] == ['balance updated']
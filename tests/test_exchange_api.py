@@ -0,0 +1,18 @@
+from requests import Response
+
+from coinbitrage.exchanges.base.api import _parse_json
+
+
+def _response(body: bytes) -> Response:
+    resp = Response()
+    resp._content = body
+    resp.encoding = 'utf-8'
+    return resp
+
+
+def test_parse_json():
+    assert _parse_json(_response(b'{"price": 0.5, "id": "42"}')) == {'price': 0.5, 'id': '42'}
+
+
+def test_parse_json_falls_back_on_byte_order_mark():
+    assert _parse_json(_response(b'\xef\xbb\xbf{"price": 0.5}')) == {'price': 0.5}